@@ -0,0 +1,107 @@
+"""
+ClassMate - Quick Key ID
+
+Prints the manifest "key" and extension ID for a packing key (.pem)
+without touching manifest.json. Handy for checking a key before packing.
+
+Usage:
+    python extract_key.py [path/to/key.pem]
+"""
+
+import base64
+import hashlib
+import sys
+
+# Hex digits map 1:1 onto the a-p alphabet, so the ID is just a translated
+# hexdigest prefix; str.translate runs the substitution in a single C loop.
+_HEX2AP = str.maketrans("0123456789abcdef", "abcdefghijklmnop")
+
+# AlgorithmIdentifier for rsaEncryption with NULL parameters.
+_RSA_ALGORITHM_ID = bytes.fromhex("300d06092a864886f70d0101010500")
+
+# Full SPKI wrapper for the common RSA-2048/e=65537 shape: outer SEQUENCE
+# header, rsaEncryption AlgorithmIdentifier and BIT STRING header are all
+# fixed bytes once the RSAPublicKey SEQUENCE is 270 bytes long.
+_SPKI_RSA2048_PREFIX = bytes.fromhex(
+    "30820122300d06092a864886f70d01010105000382010f00"
+)
+
+
+def _read_asn1_header(data, idx):
+    """Return (tag, content length, content offset) for the DER TLV at idx."""
+    tag = data[idx]
+    length = data[idx + 1]
+    idx += 2
+    if length & 0x80:
+        num_bytes = length & 0x7F
+        length = int.from_bytes(data[idx:idx + num_bytes], "big")
+        idx += num_bytes
+    return tag, length, idx
+
+
+def _der_tlv(tag, content):
+    """Encode one DER TLV from a tag and its content bytes."""
+    n = len(content)
+    if n < 0x80:
+        return bytes((tag, n)) + content
+    raw = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return bytes((tag, 0x80 | len(raw))) + raw + content
+
+
+def spki_from_private_der(der):
+    """Build the public SubjectPublicKeyInfo DER from a private-key DER.
+
+    The modulus and public exponent are the first two INTEGERs of the
+    RSAPrivateKey SEQUENCE, so the public key can be rewrapped with pure
+    byte handling - no OpenSSL key load (or its consistency checks) needed.
+    Handles both PKCS#1 ("RSA PRIVATE KEY") and PKCS#8 ("PRIVATE KEY").
+    """
+    _, _, idx = _read_asn1_header(der, 0)  # outer SEQUENCE
+    _, length, idx = _read_asn1_header(der, idx)  # version INTEGER
+    idx += length
+    tag, length, content = _read_asn1_header(der, idx)
+    if tag == 0x30:
+        # PKCS#8: skip the AlgorithmIdentifier, recurse into the OCTET STRING.
+        _, length, content = _read_asn1_header(der, content + length)
+        return spki_from_private_der(der[content:content + length])
+    modulus = der[content:content + length]
+    _, length, content = _read_asn1_header(der, content + length)
+    exponent = der[content:content + length]
+    rsa_public_key = _der_tlv(0x30, _der_tlv(0x02, modulus) + _der_tlv(0x02, exponent))
+    if len(rsa_public_key) == 270:
+        return _SPKI_RSA2048_PREFIX + rsa_public_key
+    return _der_tlv(0x30, _RSA_ALGORITHM_ID + _der_tlv(0x03, b"\x00" + rsa_public_key))
+
+
+def extract_der_from_pem(pem_content):
+    """Strip the PEM armor and return the raw DER bytes."""
+    _, begin, rest = pem_content.partition("-----BEGIN")
+    _, _, rest = rest.partition("-----")
+    body, end, _ = rest.partition("-----END")
+    if not begin or not end:
+        raise ValueError("No private key block found in PEM file")
+    # b64decode discards newlines and other non-alphabet bytes itself.
+    return base64.b64decode(body)
+
+
+def main():
+    pem_path = sys.argv[1] if len(sys.argv) > 1 else "gcr-downloader.pem"
+    try:
+        with open(pem_path, "r") as f:
+            pem_content = f.read()
+    except OSError as e:
+        print(f"Cannot read {pem_path}: {e}")
+        sys.exit(1)
+
+    der = extract_der_from_pem(pem_content)
+    public_der = spki_from_private_der(der)
+
+    hex_digest = hashlib.sha256(public_der, usedforsecurity=False).hexdigest()
+    extension_id = hex_digest[:32].translate(_HEX2AP)
+
+    print(f'manifest key: "{base64.b64encode(public_der).decode("ascii")}"')
+    print(f"extension ID: {extension_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+ClassMate - Extension Key Tool
+
+Derives the manifest.json "key" value and the resulting extension ID from
+the packing key (gcr-downloader.pem), so the unpacked extension keeps the
+same stable ID as the packed release.
+
+Usage:
+    python generate_extension_key.py [path/to/key.pem]
+"""
+
+import base64
+import hashlib
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# AlgorithmIdentifier for rsaEncryption with NULL parameters.
+_RSA_ALGORITHM_ID = bytes.fromhex("300d06092a864886f70d0101010500")
+
+# Full SPKI wrapper for the common RSA-2048/e=65537 shape: outer SEQUENCE
+# header, rsaEncryption AlgorithmIdentifier and BIT STRING header are all
+# fixed bytes once the RSAPublicKey SEQUENCE is 270 bytes long.
+_SPKI_RSA2048_PREFIX = bytes.fromhex(
+    "30820122300d06092a864886f70d01010105000382010f00"
+)
+
+# The "key" currently pinned in manifest.json.
+existing_key = (
+    "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA7UM+3EvNmeofsB5PjYQNUho1"
+    "juv6Od5GlSTxwE3HsR//vkYaijGSm8Eoq2PhcAk9u7Q9GOxO1Rma6g52kKMniMoyrRn2"
+    "en6SINh4MT3Nsj2nfe0VKDDZGVzK57co7kNrxkxtSeScDKs5/0B/CE/m3u9WXXw0XWAO"
+    "I/sl9aMFWDEUFgC2kZT0zE3yJCvQEQmN09/hG8AD9V5dazzO/gVXN6Y3gog5W3QSipel"
+    "O/Ky7f3ASaSuB2x8UojUyZxe7x4Dd1ZF9g6G6artvpMVyQeCdmLuaeebW9kxFgKyNApz"
+    "hXi+8dUe3IvjGDbjQFIvkpnQzfibRLyU6S+x/bHWGt0RKwIDAQAB"
+)
+_EXISTING_KEY_DER = base64.b64decode(existing_key)
+
+# Extension ID that the pinned key hashes to.
+EXTENSION_ID = "nkgiceemmjegjjjkpmipihmdinbahonm"
+
+# The 16 SHA-256 bytes EXTENSION_ID encodes, so the pinned key can be checked
+# with a plain prefix compare instead of rebuilding the 32-letter ID string.
+_TARGET_PREFIX = bytes(
+    (ord(hi) - 0x61) << 4 | (ord(lo) - 0x61)
+    for hi, lo in zip(EXTENSION_ID[0::2], EXTENSION_ID[1::2])
+)
+
+# Hex digits map 1:1 onto the a-p alphabet, so the ID is just a translated
+# hexdigest prefix; str.translate runs the substitution in a single C loop.
+_HEX2AP = str.maketrans("0123456789abcdef", "abcdefghijklmnop")
+
+
+PREFERRED_KEY_NAME = "gcr-downloader.pem"
+
+
+def find_pem_file():
+    """Locate the packing key: one scan of the working directory, then the
+    usual user-profile spots. scandir hands back names and file types in a
+    single pass, replacing the old exists-probe list plus glob fallback."""
+    first_pem = None
+    try:
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if not entry.name.endswith(".pem") or not entry.is_file():
+                    continue
+                if entry.name == PREFERRED_KEY_NAME:
+                    return entry.name
+                if first_pem is None:
+                    first_pem = entry.name
+    except OSError:
+        pass
+    locations = [Path(__file__).resolve().parent / PREFERRED_KEY_NAME]
+    if sys.platform == "win32":
+        # The profile spots only exist on Windows; elsewhere the old
+        # %USERPROFILE% probes were three guaranteed-miss stat calls.
+        home = Path.home()
+        locations += [
+            home / "Documents" / "GCR-Keys" / PREFERRED_KEY_NAME,
+            home / "Documents" / PREFERRED_KEY_NAME,
+            home / "Desktop" / PREFERRED_KEY_NAME,
+        ]
+    for location in locations:
+        if location.is_file():
+            return str(location)
+    return first_pem
+
+
+def _read_asn1_header(data, idx):
+    """Return (tag, content length, content offset) for the DER TLV at idx."""
+    tag = data[idx]
+    length = data[idx + 1]
+    idx += 2
+    if length & 0x80:
+        num_bytes = length & 0x7F
+        length = int.from_bytes(data[idx:idx + num_bytes], "big")
+        idx += num_bytes
+    return tag, length, idx
+
+
+def _der_tlv(tag, content):
+    """Encode one DER TLV from a tag and its content bytes."""
+    n = len(content)
+    if n < 0x80:
+        return bytes((tag, n)) + content
+    raw = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return bytes((tag, 0x80 | len(raw))) + raw + content
+
+
+def spki_from_private_der(der):
+    """Build the public SubjectPublicKeyInfo DER from a private-key DER.
+
+    The modulus and public exponent are the first two INTEGERs of the
+    RSAPrivateKey SEQUENCE, so the public key can be rewrapped with pure
+    byte handling - no OpenSSL key load (or its consistency checks) needed.
+    Handles both PKCS#1 ("RSA PRIVATE KEY") and PKCS#8 ("PRIVATE KEY").
+    """
+    _, _, idx = _read_asn1_header(der, 0)  # outer SEQUENCE
+    _, length, idx = _read_asn1_header(der, idx)  # version INTEGER
+    idx += length
+    tag, length, content = _read_asn1_header(der, idx)
+    if tag == 0x30:
+        # PKCS#8: skip the AlgorithmIdentifier, recurse into the OCTET STRING.
+        _, length, content = _read_asn1_header(der, content + length)
+        return spki_from_private_der(der[content:content + length])
+    modulus = der[content:content + length]
+    _, length, content = _read_asn1_header(der, content + length)
+    exponent = der[content:content + length]
+    rsa_public_key = _der_tlv(0x30, _der_tlv(0x02, modulus) + _der_tlv(0x02, exponent))
+    if len(rsa_public_key) == 270:
+        return _SPKI_RSA2048_PREFIX + rsa_public_key
+    return _der_tlv(0x30, _RSA_ALGORITHM_ID + _der_tlv(0x03, b"\x00" + rsa_public_key))
+
+
+def extract_der_from_pem(pem_content):
+    """Strip the PEM armor and return the raw DER bytes."""
+    _, begin, rest = pem_content.partition("-----BEGIN")
+    _, _, rest = rest.partition("-----")
+    body, end, _ = rest.partition("-----END")
+    if not begin or not end:
+        raise ValueError("No private key block found in PEM file")
+    # b64decode discards newlines and other non-alphabet bytes itself.
+    return base64.b64decode(body)
+
+
+def public_key_from_pem_to_base64(pem_path):
+    """Read a PEM private key and return its public key (SPKI DER) as base64."""
+    with open(pem_path, "r") as f:
+        der = extract_der_from_pem(f.read())
+    return base64.b64encode(spki_from_private_der(der)).decode("ascii")
+
+
+@lru_cache(maxsize=256)
+def generate_extension_id(public_key_bytes):
+    """Chrome extension ID: first 16 bytes of SHA-256, nibbles mapped to a-p.
+
+    Cached on the key bytes, so repeat queries for the same candidate or the
+    pinned key cost one dict lookup instead of a hash plus string build."""
+    hex_digest = hashlib.sha256(public_key_bytes, usedforsecurity=False).hexdigest()
+    return hex_digest[:32].translate(_HEX2AP)
+
+
+def verify_extension_id():
+    """Check that the pinned manifest key still hashes to EXTENSION_ID."""
+    digest = hashlib.sha256(_EXISTING_KEY_DER, usedforsecurity=False).digest()
+    return digest[:16] == _TARGET_PREFIX
+
+
+def main():
+    if not verify_extension_id():
+        print("WARNING: pinned manifest key does not hash to the expected ID")
+
+    pem_path = sys.argv[1] if len(sys.argv) > 1 else find_pem_file()
+    if not pem_path:
+        print("No .pem key found. Pass a path or drop gcr-downloader.pem here.")
+        sys.exit(1)
+
+    key_b64 = public_key_from_pem_to_base64(pem_path)
+    extension_id = generate_extension_id(base64.b64decode(key_b64))
+
+    print(f"PEM file:     {pem_path}")
+    print(f'manifest key: "{key_b64}"')
+    print(f"extension ID: {extension_id}")
+    if extension_id == EXTENSION_ID:
+        print("Matches the ID pinned in manifest.json")
+    else:
+        print("Does NOT match manifest.json - packing with this key changes the ID")
+
+
+if __name__ == "__main__":
+    main()